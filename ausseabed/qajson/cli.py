@@ -0,0 +1,338 @@
+"""Command line tool for working with many QA JSON files.
+
+All subcommands operate on the decoded JSON dicts directly, one file at a
+time, and never build the `QajsonRoot` object tree.
+"""
+
+from collections import Counter
+from pathlib import Path
+from typing import Any, Callable, Iterator, Optional, Sequence, TextIO
+import argparse
+import json
+import os
+import sys
+import time
+
+from jsonschema import Draft7Validator, ValidationError
+
+from ausseabed.qajson.parser import QajsonParser
+
+DATA_LEVELS = ("raw_data", "survey_products", "chart_adequacy")
+CHECK_STATES = ("pass", "fail", "warning")
+
+# used in place of a check state for checks that have no outputs, or no
+# check_state within their outputs
+NO_STATE = "none"
+# used in place of a group id for checks that have no group
+NO_GROUP = "-"
+
+
+def load_qajson(path: Path) -> dict[str, Any]:
+    with open(str(path)) as f:
+        return json.load(f)
+
+
+def check_structure(js: Any) -> None:
+    """Raises a ValueError if `js` does not have the object/array structure
+    of a QA JSON dict that the subcommands rely on. This is much cheaper
+    than, and not a replacement for, validating against the schema.
+    """
+    if not isinstance(js, dict):
+        raise ValueError("top level is not an object")
+    qa = js.get("qa") or {}
+    if not isinstance(qa, dict):
+        raise ValueError("qa is not an object")
+    for data_level in DATA_LEVELS:
+        level = qa.get(data_level) or {}
+        if not isinstance(level, dict):
+            raise ValueError("%s is not an object" % (data_level,))
+        checks = level.get("checks", [])
+        if not isinstance(checks, list) or not all(
+            isinstance(check, dict) for check in checks
+        ):
+            raise ValueError("%s checks is not an array of objects" % (data_level,))
+
+
+def iter_checks(js: dict[str, Any]) -> Iterator[tuple[str, dict[str, Any]]]:
+    """Yields a (data level name, check dict) tuple for every check in a QA
+    JSON dict
+    """
+    qa = js.get("qa") or {}
+    for data_level in DATA_LEVELS:
+        level = qa.get(data_level) or {}
+        for check in level.get("checks", []):
+            yield data_level, check
+
+
+def check_group(check: dict[str, Any]) -> tuple[str, Optional[str]]:
+    """Returns the (id, name) of the group a check belongs to"""
+    group = (check.get("info") or {}).get("group") or {}
+    return group.get("id") or NO_GROUP, group.get("name")
+
+
+def check_state(check: dict[str, Any]) -> str:
+    outputs = check.get("outputs") or {}
+    return outputs.get("check_state") or NO_STATE
+
+
+def count_checks(
+    js: dict[str, Any], group_names: Optional[dict[str, str]] = None
+) -> Counter:
+    """Counts checks by (data level, group id, check state). If given, the
+    `group_names` dict is updated with the name of each group id. Checks
+    without a group id are counted under NO_GROUP, which is never named.
+    """
+    counts: Counter = Counter()
+    for data_level, check in iter_checks(js):
+        group_id, group_name = check_group(check)
+        if group_names is not None and group_id != NO_GROUP and group_name:
+            group_names.setdefault(group_id, group_name)
+        counts[(data_level, group_id, check_state(check))] += 1
+    return counts
+
+
+class _Throughput:
+    """Tracks the number of files and bytes processed by a subcommand"""
+
+    def __init__(self):
+        self.start = time.perf_counter()
+        self.files = 0
+        self.bytes = 0
+
+    def add(self, path: Path) -> None:
+        self.files += 1
+        self.bytes += os.path.getsize(str(path))
+
+    def report(self, out: TextIO) -> None:
+        elapsed = time.perf_counter() - self.start
+        msg = "%d files, %.1f MB in %.3f s" % (self.files, self.bytes / 1e6, elapsed)
+        if elapsed > 0:
+            msg += " (%.1f files/s, %.1f MB/s)" % (
+                self.files / elapsed,
+                self.bytes / 1e6 / elapsed,
+            )
+        print(msg, file=out)
+
+
+def _print_counts(
+    title: str, counts: Counter, group_names: dict[str, str], out: TextIO
+) -> None:
+    print("%s (%d checks)" % (title, sum(counts.values())), file=out)
+    for (data_level, group_id, state), count in sorted(counts.items()):
+        group = group_id
+        if group_id in group_names:
+            group = "%s (%s)" % (group_id, group_names[group_id])
+        print("  %-16s %-40s %-8s %8d" % (data_level, group, state, count), file=out)
+
+
+def _each_file(
+    paths: Sequence[Path],
+    throughput: _Throughput,
+    fn: Callable[[Path, dict[str, Any]], None],
+) -> int:
+    """Loads each file in turn and passes it to `fn`. Files that can't be read,
+    or that `fn` fails on because of an unexpected value deeper in the
+    document, are reported to stderr and skipped. Returns the number of such
+    files.
+    """
+    errors = 0
+    for path in paths:
+        try:
+            js = load_qajson(path)
+            check_structure(js)
+        except (OSError, ValueError) as e:
+            print("error reading %s: %s" % (path, e), file=sys.stderr)
+            errors += 1
+            continue
+        try:
+            fn(path, js)
+        except (AttributeError, TypeError, KeyError) as e:
+            print(
+                "error processing %s: %s: %s" % (path, type(e).__name__, e),
+                file=sys.stderr,
+            )
+            errors += 1
+            continue
+        throughput.add(path)
+    return errors
+
+
+def cmd_stats(args: argparse.Namespace) -> int:
+    throughput = _Throughput()
+    total: Counter = Counter()
+    group_names: dict[str, str] = {}
+
+    def stats(path: Path, js: dict[str, Any]) -> None:
+        counts = count_checks(js, group_names)
+        total.update(counts)
+        if not args.summary:
+            _print_counts(str(path), counts, group_names, sys.stdout)
+
+    errors = _each_file(args.paths, throughput, stats)
+    _print_counts("total", total, group_names, sys.stdout)
+    throughput.report(sys.stderr)
+    return 1 if errors else 0
+
+
+def cmd_validate(args: argparse.Namespace) -> int:
+    throughput = _Throughput()
+    schema_path = args.schema or QajsonParser.schema_paths()[-1]
+    try:
+        validator = Draft7Validator(load_qajson(schema_path))
+    except (OSError, ValueError) as e:
+        print("error reading schema %s: %s" % (schema_path, e), file=sys.stderr)
+        return 2
+    invalid = 0
+
+    def validate(path: Path, js: dict[str, Any]) -> None:
+        nonlocal invalid
+        try:
+            validator.validate(js)
+        except ValidationError as e:
+            invalid += 1
+            print("INVALID %s: %s" % (path, e.message))
+            return
+        print("OK %s" % (path,))
+
+    errors = _each_file(args.paths, throughput, validate)
+    print("%d valid, %d invalid" % (throughput.files - invalid, invalid + errors))
+    throughput.report(sys.stderr)
+    return 1 if invalid or errors else 0
+
+
+def cmd_failures(args: argparse.Namespace) -> int:
+    throughput = _Throughput()
+    states = set(args.state or ["fail"])
+    found = 0
+
+    def failures(path: Path, js: dict[str, Any]) -> None:
+        nonlocal found
+        # lines are only printed once the whole file has been processed, so
+        # nothing is printed for a file that is skipped part way through
+        lines = []
+        file_found = 0
+        for data_level, check in iter_checks(js):
+            state = check_state(check)
+            if state not in states:
+                continue
+            file_found += 1
+            info = check.get("info") or {}
+            lines.append(
+                "%s\t%s\t%s\t%s\t%s"
+                % (path, data_level, state, info.get("id"), info.get("name", ""))
+            )
+            if args.messages:
+                outputs = check.get("outputs") or {}
+                for message in outputs.get("messages") or []:
+                    lines.append("    %s" % (message,))
+        for line in lines:
+            print(line)
+        found += file_found
+
+    errors = _each_file(args.paths, throughput, failures)
+    print("%d checks found" % (found,), file=sys.stderr)
+    throughput.report(sys.stderr)
+    return 1 if errors else 0
+
+
+def cmd_merge(args: argparse.Namespace) -> int:
+    throughput = _Throughput()
+    version: Optional[str] = None
+    levels: dict[str, list[dict[str, Any]]] = {}
+
+    def merge(path: Path, js: dict[str, Any]) -> None:
+        nonlocal version
+        qa = js.get("qa") or {}
+        if version is None:
+            version = qa.get("version")
+        for data_level in DATA_LEVELS:
+            if data_level in qa:
+                checks = levels.setdefault(data_level, [])
+                checks.extend((qa[data_level] or {}).get("checks", []))
+
+    errors = _each_file(args.paths, throughput, merge)
+    if errors:
+        throughput.report(sys.stderr)
+        return 1
+
+    qa: dict[str, Any] = {
+        "version": version,
+        "raw_data": {"checks": levels.get("raw_data", [])},
+        "survey_products": {"checks": levels.get("survey_products", [])},
+    }
+    if "chart_adequacy" in levels:
+        qa["chart_adequacy"] = {"checks": levels["chart_adequacy"]}
+
+    if args.output is None:
+        json.dump({"qa": qa}, sys.stdout, indent=args.indent)
+        sys.stdout.write("\n")
+    else:
+        with open(str(args.output), "w") as f:
+            json.dump({"qa": qa}, f, indent=args.indent)
+    throughput.report(sys.stderr)
+    return 0
+
+
+def build_arg_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="qajson", description="Summarise, validate and merge QA JSON files"
+    )
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    stats = subparsers.add_parser(
+        "stats", help="count checks by data level, group and check state"
+    )
+    stats.add_argument(
+        "--summary",
+        action="store_true",
+        help="only print the aggregate counts over all files",
+    )
+    stats.set_defaults(func=cmd_stats)
+
+    validate = subparsers.add_parser(
+        "validate", help="validate files against the QA JSON schema"
+    )
+    validate.add_argument(
+        "--schema",
+        type=Path,
+        default=None,
+        help="schema to validate against, defaults to the latest schema",
+    )
+    validate.set_defaults(func=cmd_validate)
+
+    failures = subparsers.add_parser(
+        "failures", help="list checks with a given check state"
+    )
+    failures.add_argument(
+        "--state",
+        action="append",
+        choices=CHECK_STATES + (NO_STATE,),
+        help="check state to list, may be given multiple times (default: fail)",
+    )
+    failures.add_argument(
+        "--messages", action="store_true", help="also print the check messages"
+    )
+    failures.set_defaults(func=cmd_failures)
+
+    merge = subparsers.add_parser(
+        "merge", help="merge the checks of all files into a single QA JSON file"
+    )
+    merge.add_argument(
+        "-o", "--output", type=Path, default=None, help="defaults to stdout"
+    )
+    merge.add_argument("--indent", type=int, default=4)
+    merge.set_defaults(func=cmd_merge)
+
+    for subparser in (stats, validate, failures, merge):
+        subparser.add_argument("paths", nargs="+", type=Path, metavar="path")
+
+    return parser
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    args = build_arg_parser().parse_args(argv)
+    return args.func(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,17 +1,29 @@
-from typing import Any
+from typing import Any, Iterable
 from abc import ABC, abstractmethod
+from concurrent.futures import ProcessPoolExecutor
+from itertools import groupby
 
 import json
 import logging
 
 logger = logging.getLogger(__name__)
 
+# number of check dicts sent to a worker process in a single task when
+# building the object tree in parallel
+DEFAULT_CHUNK_SIZE = 500
+
 
 class QajsonObject(ABC):
     @abstractmethod
     def to_dict(self) -> dict[str, Any]:
         pass
 
+    def to_json(self, **kwargs: Any) -> str:
+        """Serialises this object to a JSON string, keyword arguments are
+        passed to `json.dumps`
+        """
+        return json.dumps(self.to_dict(), **kwargs)
+
     def __repr__(self):
         return type(self).__name__ + "\n" + json.dumps(self.to_dict(), indent=4) + "\n"
 
@@ -242,10 +254,16 @@ class QajsonOutputs(QajsonObject):
         self.data = data
         self.check_state = check_state
 
+    def _files_to_dicts(self) -> list[dict[str, Any]] | None:
+        if self.files is None:
+            return None
+        return [file.to_dict() for file in self.files]
+
     def to_dict(self) -> dict[str, Any]:
         out: dict[str, Any] = {"execution": self.execution.to_dict()}
-        if self.files is not None:
-            out["files"] = [file.to_dict() for file in self.files]
+        files = self._files_to_dicts()
+        if files is not None:
+            out["files"] = files
         if self.count is not None:
             out["count"] = self.count
         if self.percentage is not None:
@@ -259,6 +277,124 @@ class QajsonOutputs(QajsonObject):
         return out
 
 
+class QajsonOutputsBuilder(QajsonOutputs):
+    """Bulk alternative to QajsonOutputs for checks that emit a large number
+    of output files. Files are added in batches, each stored once as an
+    immutable (paths, file_type, description) run in `file_runs` rather than
+    as one QajsonFile per path; `to_dict` expands the runs directly.
+
+    Unlike QajsonOutputs, `files` is a read-only tuple built from the runs
+    (and cached until the runs change). Files must be added with
+    `add_files`, or replaced by assigning a new list to `files`.
+    """
+
+    def __init__(
+        self,
+        execution: QajsonExecution | None = None,
+        files: list[QajsonFile] | None = None,
+        count: int | None = None,
+        percentage: float | None = None,
+        messages: list[str] | None = None,
+        data: dict[str, Any] | None = None,
+        check_state: str | None = None,
+    ):
+        self.file_runs: list[tuple[tuple[str, ...], str, str | None]] | None = None
+        # (runs, files) the files tuple was last built from
+        self._files_cache: tuple[Any, ...] | None = None
+        super().__init__(
+            execution=execution,
+            files=files,
+            count=count,
+            percentage=percentage,
+            messages=messages,
+            data=data,
+            check_state=check_state,
+        )
+
+    @property  # type: ignore[override]
+    def files(self) -> tuple[QajsonFile, ...] | None:
+        if self.file_runs is None:
+            return None
+        # runs are immutable tuples, so the cache is valid for as long as
+        # the list holds the same runs
+        runs = tuple(self.file_runs)
+        if self._files_cache is None or self._files_cache[0] != runs:
+            files = tuple(
+                QajsonFile(path, file_type, description)
+                for paths, file_type, description in runs
+                for path in paths
+            )
+            self._files_cache = (runs, files)
+        return self._files_cache[1]
+
+    @files.setter
+    def files(self, value: Iterable[QajsonFile] | None) -> None:
+        if value is None:
+            self.file_runs = None
+            return
+        self.file_runs = []
+        # consecutive files that share a file type and description are
+        # stored as a single run
+        for (file_type, description), group in groupby(
+            value, key=lambda file: (file.file_type, file.description)
+        ):
+            self.add_files([file.path for file in group], file_type, description)
+
+    @property
+    def file_count(self) -> int:
+        if self.file_runs is None:
+            return 0
+        return sum(len(paths) for paths, _, _ in self.file_runs)
+
+    def add_files(
+        self,
+        paths: Iterable[str],
+        file_type: str,
+        description: str | None = None,
+    ) -> None:
+        """Adds a batch of output files that share the same file type and
+        description
+        """
+        if isinstance(paths, str):
+            raise TypeError("paths must be an iterable of paths, not a str")
+        if self.file_runs is None:
+            self.file_runs = []
+        self.file_runs.append((tuple(paths), file_type, description))
+
+    def __getstate__(self) -> dict[str, Any]:
+        # the cached files are rebuilt on demand rather than copied
+        state = self.__dict__.copy()
+        state["_files_cache"] = None
+        return state
+
+    def add_messages(self, messages: Iterable[str]) -> None:
+        if isinstance(messages, str):
+            raise TypeError("messages must be an iterable of messages, not a str")
+        if self.messages is None:
+            self.messages = []
+        self.messages.extend(messages)
+
+    def update_data(self, data: dict[str, Any]) -> None:
+        if self.data is None:
+            self.data = {}
+        self.data.update(data)
+
+    def build(self) -> QajsonOutputs:
+        """Converts this builder into a QajsonOutputs object"""
+        return QajsonOutputs.from_dict(self.to_dict())
+
+    def _files_to_dicts(self) -> list[dict[str, Any]] | None:
+        if self.file_runs is None:
+            return None
+        return [
+            {"path": path, "file_type": file_type}
+            if description is None
+            else {"path": path, "file_type": file_type, "description": description}
+            for paths, file_type, description in self.file_runs
+            for path in paths
+        ]
+
+
 class QajsonCheck(QajsonObject):
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> "QajsonCheck":
@@ -289,6 +425,29 @@ class QajsonCheck(QajsonObject):
             self.inputs = QajsonInputs(files=[], params=[])
         return self.inputs
 
+    def add_outputs_builder(
+        self,
+        execution: QajsonExecution | None = None,
+        count: int | None = None,
+        percentage: float | None = None,
+        messages: list[str] | None = None,
+        data: dict[str, Any] | None = None,
+        check_state: str | None = None,
+    ) -> QajsonOutputsBuilder:
+        """Replaces the outputs of this check with a new QajsonOutputsBuilder
+        and returns it
+        """
+        builder = QajsonOutputsBuilder(
+            execution=execution,
+            count=count,
+            percentage=percentage,
+            messages=messages,
+            data=data,
+            check_state=check_state,
+        )
+        self.outputs = builder
+        return builder
+
     def to_dict(self) -> dict[str, Any]:
         out = {
             "info": self.info.to_dict(),
@@ -328,11 +487,122 @@ class QajsonDataLevel(QajsonObject):
         return {"checks": [check.to_dict() for check in self.checks]}
 
 
+# Checks built in a worker process are sent back to the parent as nested
+# tuples of constructor arguments rather than pickled object graphs, which
+# are larger and slower to unpickle. The tuple layout is private to the
+# functions below.
+
+
+def _file_to_tuple(file: QajsonFile) -> tuple[Any, ...]:
+    return (file.path, file.file_type, file.description)
+
+
+def _check_to_tuple(check: QajsonCheck) -> tuple[Any, ...]:
+    info = check.info
+    group = info.group
+    info_tuple = (
+        info.id,
+        info.name,
+        info.description,
+        info.version,
+        None if group is None else (group.id, group.name, group.description),
+    )
+
+    inputs_tuple = None
+    if check.inputs is not None:
+        inputs_tuple = (
+            [_file_to_tuple(file) for file in check.inputs.files],
+            [(param.name, param.value, param.options) for param in check.inputs.params],
+        )
+
+    outputs_tuple = None
+    outputs = check.outputs
+    if outputs is not None:
+        execution = outputs.execution
+        outputs_tuple = (
+            (execution.start, execution.end, execution.status, execution.error),
+            None
+            if outputs.files is None
+            else [_file_to_tuple(file) for file in outputs.files],
+            outputs.count,
+            outputs.percentage,
+            outputs.messages,
+            outputs.data,
+            outputs.check_state,
+        )
+
+    return (info_tuple, inputs_tuple, outputs_tuple)
+
+
+def _check_from_tuple(check_tuple: tuple[Any, ...]) -> QajsonCheck:
+    info_tuple, inputs_tuple, outputs_tuple = check_tuple
+
+    id, name, description, version, group_tuple = info_tuple
+    info = QajsonInfo(
+        id=id,
+        name=name,
+        description=description,
+        version=version,
+        group=None if group_tuple is None else QajsonGroup(*group_tuple),
+    )
+
+    inputs = None
+    if inputs_tuple is not None:
+        inputs = QajsonInputs(
+            files=[QajsonFile(*file_tuple) for file_tuple in inputs_tuple[0]],
+            params=[QajsonParam(*param_tuple) for param_tuple in inputs_tuple[1]],
+        )
+
+    outputs = None
+    if outputs_tuple is not None:
+        files_tuple = outputs_tuple[1]
+        outputs = QajsonOutputs(
+            QajsonExecution(*outputs_tuple[0]),
+            None
+            if files_tuple is None
+            else [QajsonFile(*file_tuple) for file_tuple in files_tuple],
+            *outputs_tuple[2:],
+        )
+
+    return QajsonCheck(info=info, inputs=inputs, outputs=outputs)
+
+
+def _check_tuples_from_dicts(
+    check_dicts: list[dict[str, Any]],
+) -> list[tuple[Any, ...]]:
+    """Builds a list of checks from their dict representation and returns
+    them in tuple form. Module level so that it can be run in a worker
+    process.
+    """
+    return [
+        _check_to_tuple(QajsonCheck.from_dict(check_dict)) for check_dict in check_dicts
+    ]
+
+
 class QajsonQa(QajsonObject):
     """Represents QA JSON QA object. Includes metadata about the QA JSON"""
 
     @classmethod
-    def from_dict(cls, data: dict[str, Any]) -> "QajsonQa":
+    def from_dict(
+        cls,
+        data: dict[str, Any],
+        max_workers: int | None = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> "QajsonQa":
+        """Builds the QA object from its dict representation. If `max_workers`
+        is given the checks of all data levels are split into chunks of
+        `chunk_size` and built in a pool of `max_workers` processes, otherwise
+        everything is built serially in the calling process.
+
+        Note: the parallel path is currently slower than the serial one at
+        every document size measured. The calling process still has to send
+        each check dict to a worker and turn each result back into objects,
+        and that rebuild alone costs about as much as a serial build (see
+        `benchmarks/bench_parallel_from_dict.py`).
+        """
+        if max_workers is not None:
+            return cls._from_dict_parallel(data, max_workers, chunk_size)
+
         version = data.get("version", None)
         chart_adequacy = (
             QajsonDataLevel.from_dict(data["chart_adequacy"])
@@ -359,6 +629,54 @@ class QajsonQa(QajsonObject):
         self.survey_products = survey_products
         self.chart_adequacy = chart_adequacy
 
+    @classmethod
+    def _from_dict_parallel(
+        cls,
+        data: dict[str, Any],
+        max_workers: int,
+        chunk_size: int,
+    ) -> "QajsonQa":
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be a positive integer")
+
+        # raw_data and survey_products are required, chart_adequacy is not
+        level_dicts = {
+            "raw_data": data["raw_data"],
+            "survey_products": data["survey_products"],
+        }
+        if "chart_adequacy" in data:
+            level_dicts["chart_adequacy"] = data["chart_adequacy"]
+
+        levels = {}
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            futures = {}
+            for name, level_dict in level_dicts.items():
+                check_dicts = level_dict.get("checks", [])
+                futures[name] = [
+                    executor.submit(
+                        _check_tuples_from_dicts, check_dicts[i : i + chunk_size]
+                    )
+                    for i in range(0, len(check_dicts), chunk_size)
+                ]
+            # chunks are reassembled in submission order so the order of
+            # checks matches the serial implementation
+            for name, level_futures in futures.items():
+                checks: list[QajsonCheck] = []
+                for future in level_futures:
+                    checks.extend(
+                        _check_from_tuple(check_tuple)
+                        for check_tuple in future.result()
+                    )
+                levels[name] = QajsonDataLevel(checks=checks)
+
+        instance = cls(
+            version=data.get("version", None),
+            raw_data=levels["raw_data"],
+            survey_products=levels["survey_products"],
+            chart_adequacy=levels.get("chart_adequacy", None),
+        )
+        return instance
+
     def get_or_add_data_level(self, data_level: str) -> QajsonDataLevel:
         """If a data level exists in the `qa` object it will be returned,
         otherwise a new QajsonDataLevel will be created, added to the qa object
@@ -392,9 +710,20 @@ class QajsonRoot(QajsonObject):
     """Represents root of a QA JSON file"""
 
     @classmethod
-    def from_dict(cls, data: dict[str, Any]) -> "QajsonRoot":
+    def from_dict(
+        cls,
+        data: dict[str, Any],
+        max_workers: int | None = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> "QajsonRoot":
+        """Builds the QA JSON object tree from its dict representation. See
+        `QajsonQa.from_dict` for a description of `max_workers` and
+        `chunk_size`.
+        """
         instance = cls(
-            qa=QajsonQa.from_dict(data["qa"]),
+            qa=QajsonQa.from_dict(
+                data["qa"], max_workers=max_workers, chunk_size=chunk_size
+            ),
         )
         return instance
 
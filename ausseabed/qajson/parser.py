@@ -4,7 +4,7 @@ from typing import Optional, Dict, Any
 import json
 import logging
 
-from ausseabed.qajson.model import QajsonRoot
+from ausseabed.qajson.model import DEFAULT_CHUNK_SIZE, QajsonRoot
 
 logger = logging.getLogger(__name__)
 
@@ -73,6 +73,8 @@ class QajsonParser:
         path: Path,
         schema_path: Optional[Path] = None,
         check_valid: bool = True,
+        max_workers: Optional[int] = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
     ):
         self._path = Path(path)
         if schema_path is None:
@@ -94,7 +96,9 @@ class QajsonParser:
                 raise RuntimeError("invalid json: %s" % self._path)
 
         self._js: dict[str, Any] = json.loads(open(str(self._path)).read())
-        self._root = QajsonRoot.from_dict(self.js)
+        self._root = QajsonRoot.from_dict(
+            self.js, max_workers=max_workers, chunk_size=chunk_size
+        )
 
     @property
     def path(self) -> Path:
@@ -0,0 +1,112 @@
+"""Compares serial and parallel construction of the QAJSON object tree.
+
+Builds synthetic QA JSON documents of increasing size and times
+`QajsonRoot.from_dict` with and without a process pool. Requires the package
+to be installed (eg; `pip install -e .`).
+
+    python benchmarks/bench_parallel_from_dict.py --workers 4
+"""
+
+import argparse
+import os
+import time
+
+from ausseabed.qajson.model import DEFAULT_CHUNK_SIZE, QajsonRoot
+
+
+def make_check(index: int, n_files: int) -> dict:
+    files = [
+        {"path": "data/file_%d_%d.all" % (index, i), "file_type": "Raw Files"}
+        for i in range(n_files)
+    ]
+    return {
+        "info": {
+            "id": "check-%d" % index,
+            "name": "Check %d" % index,
+            "version": "1",
+            "group": {"id": "group-%d" % (index % 5), "name": "Group"},
+        },
+        "inputs": {
+            "files": files,
+            "params": [{"name": "threshold", "value": index}],
+        },
+        "outputs": {
+            "execution": {
+                "start": "2019-07-08T14:56:49.006647",
+                "end": "2019-07-08T14:56:49.006677",
+                "status": "completed",
+            },
+            "files": files,
+            "messages": ["message %d" % i for i in range(n_files)],
+            "check_state": "pass",
+        },
+    }
+
+
+def make_document(n_checks: int, n_files: int) -> dict:
+    checks = [make_check(i, n_files) for i in range(n_checks)]
+    return {
+        "qa": {
+            "version": "0.1.4",
+            "raw_data": {"checks": checks},
+            "survey_products": {"checks": checks},
+            "chart_adequacy": {"checks": checks},
+        }
+    }
+
+
+def best_of(repeat: int, fn) -> float:
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--workers", type=int, default=os.cpu_count())
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE)
+    parser.add_argument("--files-per-check", type=int, default=10)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument(
+        "--sizes",
+        type=int,
+        nargs="+",
+        default=[100, 1000, 5000, 20000, 50000],
+        help="checks per data level of each synthetic document, in ascending order",
+    )
+    args = parser.parse_args()
+
+    print(
+        "workers: %d, chunk size: %d, files per check: %d"
+        % (args.workers, args.chunk_size, args.files_per_check)
+    )
+    print("%12s %12s %12s %8s" % ("checks", "serial (s)", "parallel (s)", "ratio"))
+    crossover = None
+    for n_checks in args.sizes:
+        document = make_document(n_checks, args.files_per_check)
+        serial = best_of(args.repeat, lambda: QajsonRoot.from_dict(document))
+        parallel = best_of(
+            args.repeat,
+            lambda: QajsonRoot.from_dict(
+                document, max_workers=args.workers, chunk_size=args.chunk_size
+            ),
+        )
+        ratio = serial / parallel
+        print("%12d %12.3f %12.3f %8.2f" % (n_checks * 3, serial, parallel, ratio))
+        if crossover is None and ratio > 1:
+            crossover = n_checks * 3
+
+    if crossover is None:
+        print(
+            "no crossover: parallel was slower than serial at every size up to "
+            "%d checks" % (args.sizes[-1] * 3,)
+        )
+    else:
+        print("crossover: parallel is faster than serial from %d checks" % crossover)
+
+
+if __name__ == "__main__":
+    main()
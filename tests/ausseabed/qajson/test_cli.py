@@ -0,0 +1,139 @@
+import contextlib
+import io
+import json
+import os
+import tempfile
+import unittest
+
+from ausseabed.qajson.cli import main, count_checks, load_qajson
+from ausseabed.qajson.parser import QajsonParser
+
+
+class TestCli(unittest.TestCase):
+    here = os.path.abspath(os.path.dirname(__file__))
+    test_file = os.path.join(here, "qa_json_test.json")
+
+    def run_main(self, argv):
+        out = io.StringIO()
+        with contextlib.redirect_stdout(out), contextlib.redirect_stderr(io.StringIO()):
+            rc = main(argv)
+        return rc, out.getvalue()
+
+    def test_count_checks(self):
+        counts = count_checks(load_qajson(self.test_file))
+        self.assertEqual(counts[("raw_data", "123", "fail")], 1)
+        self.assertEqual(counts[("raw_data", "123", "pass")], 1)
+        self.assertEqual(counts[("raw_data", "123", "warning")], 1)
+        self.assertEqual(counts[("raw_data", "123", "none")], 5)
+
+    def test_stats(self):
+        rc, out = self.run_main(["stats", "--summary", self.test_file, self.test_file])
+        self.assertEqual(rc, 0)
+        self.assertIn("total (16 checks)", out)
+
+    def test_count_checks_group_id(self):
+        def check(group):
+            return {"info": {"id": "1", "group": group}}
+
+        js = {
+            "qa": {
+                "raw_data": {
+                    "checks": [
+                        check({"id": "a", "name": "same"}),
+                        check({"id": "b", "name": "same"}),
+                        check({"name": "no id"}),
+                    ]
+                },
+            }
+        }
+        group_names = {}
+        counts = count_checks(js, group_names)
+        self.assertEqual(counts[("raw_data", "a", "none")], 1)
+        self.assertEqual(counts[("raw_data", "b", "none")], 1)
+        self.assertEqual(counts[("raw_data", "-", "none")], 1)
+        # checks without a group id are not labelled with a group name
+        self.assertEqual(group_names, {"a": "same", "b": "same"})
+
+    def test_not_qajson(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            bad_files = []
+            for i, content in enumerate(["[1, 2]", '{"qa": [1]}', '{"qa": null}']):
+                bad_files.append(os.path.join(tmp, "bad_%d.json" % i))
+                with open(bad_files[-1], "w") as f:
+                    f.write(content)
+
+            rc, out = self.run_main(["stats", "--summary", self.test_file] + bad_files)
+            self.assertEqual(rc, 1)
+            self.assertIn("total (8 checks)", out)
+
+            # a null qa object is treated as an empty one
+            merged = os.path.join(tmp, "merged.json")
+            rc, _ = self.run_main(["merge", "-o", merged, bad_files[2]])
+            self.assertEqual(rc, 0)
+
+    def test_malformed_nested_values(self):
+        failed = load_qajson(self.test_file)["qa"]["raw_data"]["checks"][1]
+        malformed = [
+            {"info": "x"},
+            {"info": {"id": "1", "group": {"id": ["x"]}}},
+            {**failed, "outputs": {**failed["outputs"], "messages": 1}},
+        ]
+        with tempfile.TemporaryDirectory() as tmp:
+            bad_files = []
+            for i, check in enumerate(malformed):
+                bad_files.append(os.path.join(tmp, "bad_%d.json" % i))
+                with open(bad_files[-1], "w") as f:
+                    json.dump({"qa": {"raw_data": {"checks": [check]}}}, f)
+
+            # stats does not look at messages, so only the first two are skipped
+            rc, out = self.run_main(["stats", "--summary", self.test_file] + bad_files)
+            self.assertEqual(rc, 1)
+            self.assertIn("total (9 checks)", out)
+
+            rc, out = self.run_main(
+                ["failures", "--messages", self.test_file] + bad_files
+            )
+            self.assertEqual(rc, 1)
+            self.assertEqual(out.count("Date checked"), 1)
+            self.assertNotIn(bad_files[2], out)
+
+            # null messages are treated as no messages
+            check = {**failed, "outputs": {**failed["outputs"], "messages": None}}
+            with open(bad_files[0], "w") as f:
+                json.dump({"qa": {"raw_data": {"checks": [check]}}}, f)
+            rc, out = self.run_main(["failures", "--messages", bad_files[0]])
+            self.assertEqual(rc, 0)
+            self.assertIn(bad_files[0], out)
+
+    def test_validate_missing_schema(self):
+        rc, _ = self.run_main(["validate", "--schema", "missing.json", self.test_file])
+        self.assertEqual(rc, 2)
+
+    def test_stats_missing_file(self):
+        rc, out = self.run_main(["stats", self.test_file, "missing.json"])
+        self.assertEqual(rc, 1)
+        self.assertIn("total (8 checks)", out)
+
+    def test_validate(self):
+        rc, out = self.run_main(["validate", self.test_file])
+        self.assertEqual(rc, 0)
+        self.assertIn("1 valid, 0 invalid", out)
+
+    def test_failures(self):
+        rc, out = self.run_main(["failures", "--state", "warning", self.test_file])
+        self.assertEqual(rc, 0)
+        self.assertEqual(len(out.splitlines()), 1)
+        self.assertIn("Bathymetry Available", out)
+
+    def test_merge(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            merged = os.path.join(tmp, "merged.json")
+            rc, _ = self.run_main(
+                ["merge", "-o", merged, self.test_file, self.test_file]
+            )
+            self.assertEqual(rc, 0)
+            self.assertEqual(sum(count_checks(load_qajson(merged)).values()), 16)
+            self.assertIn("chart_adequacy", load_qajson(merged)["qa"])
+            self.assertTrue(
+                QajsonParser.validate_qa_json(merged, QajsonParser.schema_paths()[-1])
+            )
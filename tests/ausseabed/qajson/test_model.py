@@ -1,3 +1,5 @@
+import copy
+import pickle
 import unittest
 
 from ausseabed.qajson.model import (
@@ -5,7 +7,11 @@ from ausseabed.qajson.model import (
     QajsonParam,
     QajsonInputs,
     QajsonOutputs,
+    QajsonOutputsBuilder,
+    QajsonCheck,
+    QajsonExecution,
     QajsonInfo,
+    QajsonRoot,
 )
 
 
@@ -104,3 +110,156 @@ class TestModel(unittest.TestCase):
     def test_qajson_info(self):
         i1 = QajsonInfo.from_dict(TestModel.qajson_info)
         self.assertDictEqual(TestModel.qajson_info, i1.to_dict())
+
+    def test_qajson_root_parallel(self):
+        check = {"info": TestModel.qajson_info, "outputs": TestModel.qajson_outputs}
+        check_inputs = {
+            "info": {"id": "no-group"},
+            "inputs": {
+                "files": [TestModel.qajson_file_dict],
+                "params": [{"name": "p", "value": 1, "options": [1, 2]}],
+            },
+            "outputs": TestModel.qajson_outputs_data,
+        }
+        root_dict = {
+            "qa": {
+                "version": "0.1.4",
+                "raw_data": {"checks": [check, check_inputs] * 4},
+                "survey_products": {"checks": [check_inputs]},
+            }
+        }
+        # small chunk size so the checks are split across several tasks
+        r1 = QajsonRoot.from_dict(root_dict, max_workers=2, chunk_size=3)
+        self.assertIsNone(r1.qa.chart_adequacy)
+        self.assertDictEqual(QajsonRoot.from_dict(root_dict).to_dict(), r1.to_dict())
+
+    def test_qajson_outputs_builder(self):
+        o1 = QajsonOutputs.from_dict(TestModel.qajson_outputs)
+        b1 = QajsonOutputsBuilder(
+            execution=QajsonExecution.from_dict(TestModel.qajson_outputs["execution"]),
+            percentage=55,
+            check_state="pass",
+        )
+        b1.add_files((f["path"] for f in TestModel.qajson_outputs["files"]), "unknown")
+        b1.add_messages(["message one"])
+        b1.add_messages(iter(["message two"]))
+        self.assertEqual(b1.file_count, 2)
+        # one run stored for the whole batch of files
+        self.assertEqual(b1.file_runs, [(("t3.txt", "t4.txt"), "unknown", None)])
+        self.assertDictEqual(TestModel.qajson_outputs, b1.to_dict())
+        self.assertDictEqual(o1.to_dict(), b1.build().to_dict())
+        self.assertEqual(o1.to_json(), b1.to_json())
+        self.assertEqual(
+            [f.to_dict() for f in o1.files], [f.to_dict() for f in b1.files]
+        )
+
+        b2 = pickle.loads(pickle.dumps(b1))
+        self.assertIsInstance(b2, QajsonOutputsBuilder)
+        self.assertEqual(b2.file_runs, b1.file_runs)
+        self.assertDictEqual(b1.to_dict(), b2.to_dict())
+
+    def test_qajson_outputs_builder_files(self):
+        b1 = QajsonOutputsBuilder()
+        b1.add_files(["a.txt"], "unknown")
+        files = b1.files
+        self.assertIsInstance(files, tuple)
+        # the view is cached until the runs change
+        self.assertIs(files, b1.files)
+        with self.assertRaises(AttributeError):
+            files.append(QajsonFile("b.txt", "unknown", None))
+        b1.add_files(["b.txt"], "unknown")
+        self.assertEqual([f.path for f in b1.files], ["a.txt", "b.txt"])
+        self.assertEqual(b1.file_count, 2)
+
+        b2 = pickle.loads(pickle.dumps(b1))
+        self.assertIsNone(b2._files_cache)
+        self.assertEqual([f.path for f in b2.files], ["a.txt", "b.txt"])
+
+    def test_qajson_outputs_builder_files_setter(self):
+        files = [
+            QajsonFile("a.txt", "unknown", None),
+            QajsonFile("b.txt", "unknown", None),
+            QajsonFile("c.txt", "raw", "desc"),
+            QajsonFile("d.txt", "raw", "desc"),
+            QajsonFile("e.txt", "unknown", None),
+        ]
+        b1 = QajsonOutputsBuilder(files=files)
+        # consecutive files with the same type and description share a run
+        self.assertEqual(
+            b1.file_runs,
+            [
+                (("a.txt", "b.txt"), "unknown", None),
+                (("c.txt", "d.txt"), "raw", "desc"),
+                (("e.txt",), "unknown", None),
+            ],
+        )
+        self.assertDictEqual(QajsonOutputs(files=files).to_dict(), b1.to_dict())
+
+    def test_qajson_outputs_builder_matches_outputs(self):
+        # empty and missing lists serialise the same way as QajsonOutputs
+        for kwargs in [{}, {"files": [], "messages": []}]:
+            o1 = QajsonOutputs(**kwargs)
+            b1 = QajsonOutputsBuilder(**kwargs)
+            self.assertDictEqual(o1.to_dict(), b1.to_dict())
+
+        b2 = QajsonOutputsBuilder()
+        b2.add_files([], "unknown")
+        b2.add_messages([])
+        self.assertEqual(b2.to_dict()["files"], [])
+        self.assertEqual(b2.to_dict()["messages"], [])
+
+    def test_qajson_outputs_builder_rejects_str(self):
+        b1 = QajsonOutputsBuilder()
+        with self.assertRaises(TypeError):
+            b1.add_files("a.txt", "unknown")
+        with self.assertRaises(TypeError):
+            b1.add_messages("message")
+        self.assertIsNone(b1.files)
+        self.assertIsNone(b1.messages)
+
+    def test_qajson_check_outputs_builder(self):
+        check = QajsonCheck(info=QajsonInfo.from_dict(TestModel.qajson_info))
+        builder = check.add_outputs_builder(count=2, check_state="fail")
+        builder.add_files(["a.txt", "b.txt"], "unknown", description="desc")
+        builder.update_data({"var1": 1234})
+        self.assertIs(check.outputs, builder)
+        outputs = check.to_dict()["outputs"]
+        self.assertEqual(
+            outputs["files"][1], QajsonFile("b.txt", "unknown", "desc").to_dict()
+        )
+        self.assertDictEqual(outputs["data"], {"var1": 1234})
+        self.assertEqual(outputs["count"], 2)
+        self.assertEqual(outputs["check_state"], "fail")
+
+    def test_qajson_check_subclass_deepcopy(self):
+        class RunnerCheck(QajsonCheck):
+            def __init__(self, info, runner):
+                super().__init__(info=info)
+                self.runner = runner
+
+        c1 = RunnerCheck(QajsonInfo.from_dict(TestModel.qajson_info), "runner")
+        c1.info.extra = 1
+        c2 = copy.deepcopy(c1)
+        self.assertIsInstance(c2, RunnerCheck)
+        self.assertEqual(c2.runner, "runner")
+        self.assertEqual(c2.info.extra, 1)
+        self.assertDictEqual(c1.to_dict(), c2.to_dict())
+
+    def test_qajson_root_pickle(self):
+        check = {
+            "info": TestModel.qajson_info,
+            "inputs": TestModel.qajson_inputs,
+            "outputs": TestModel.qajson_outputs,
+        }
+        root_dict = {
+            "qa": {
+                "version": "0.1.4",
+                "raw_data": {"checks": [check]},
+                "survey_products": {"checks": []},
+                "chart_adequacy": {"checks": [check]},
+            }
+        }
+        r1 = QajsonRoot.from_dict(root_dict)
+        r2 = pickle.loads(pickle.dumps(r1))
+        self.assertIsInstance(r2, QajsonRoot)
+        self.assertDictEqual(root_dict, r2.to_dict())
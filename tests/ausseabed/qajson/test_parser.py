@@ -20,3 +20,15 @@ class TestParser(unittest.TestCase):
         self.assertIsInstance(qajson.root.qa.raw_data, QajsonDataLevel)
         self.assertIsInstance(qajson.root.qa.survey_products, QajsonDataLevel)
         self.assertIsInstance(qajson.root.qa.chart_adequacy, QajsonDataLevel)
+
+    def test_qajson_read_parallel(self):
+        here = os.path.abspath(os.path.dirname(__file__))
+        test_file = os.path.join(here, "qa_json_test.json")
+
+        serial = QajsonParser(test_file)
+        parallel = QajsonParser(
+            test_file, check_valid=False, max_workers=2, chunk_size=3
+        )
+
+        self.assertIsInstance(parallel.root.qa.chart_adequacy, QajsonDataLevel)
+        self.assertDictEqual(serial.root.to_dict(), parallel.root.to_dict())